@@ -1026,7 +1026,7 @@ class BufferStore(collections.abc.Mapping[BufferKey, Buffer]):
     @staticmethod
     def _make_params(attrs: dict[str, Any]) -> Iterator[Parameter]:
         for index, param in enumerate(attrs.pop('params', [])):
-            param.setdefault('id', index)
+            param = {'id': index, **param}
             param['ctype'] = Parameter.parse_ctype(param.pop('type'))
             yield Parameter(**param)
 
@@ -1049,6 +1049,9 @@ class BufferStore(collections.abc.Mapping[BufferKey, Buffer]):
         """
         catalog_types = {}
         for type_name, attrs in catalog.items():
+            # Copy the attributes because the same raw catalog may be shared with
+            # (and later pickled for) other processes.
+            attrs = dict(attrs)
             params = list(cls._make_params(attrs))
             base_type = DeviceBuffer if 'device_id' in attrs else Buffer
             catalog_types[type_name] = base_type.make_type(type_name, params, **attrs)
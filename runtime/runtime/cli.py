@@ -468,6 +468,23 @@ get_zmq_option = lambda option: getattr(zmq, option.upper())
     default=1,
     help='Number of threads to spawn for executing blocking code.',
 )
+@optgroup.option(
+    '--thread-pool-kind',
+    type=click.Choice(['default', 'stealing'], case_sensitive=False),
+    default='default',
+    help=(
+        'Thread pool implementation. '
+        '"stealing" gives each thread its own work queue to reduce lock contention.'
+    ),
+)
+@optgroup.option(
+    '--fd-prewarm',
+    type=click.IntRange(min=1),
+    help=(
+        'Number of file descriptor table entries to allocate at startup (Linux only). '
+        'Defaults to 1024 plus eight per thread pool worker.'
+    ),
+)
 @optgroup.option(
     '--service-workers',
     callback=make_converter(check_positive),
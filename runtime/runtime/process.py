@@ -7,19 +7,26 @@ consumption by service handlers and tools implementing Runtime's business logic.
 
 import abc
 import asyncio
+import atexit
+import collections
 import contextlib
+import fcntl
 import functools
+import itertools
 import multiprocessing
+import os
+import resource
 import signal
 import socket
 import struct
+import sys
 import threading
 import types
-from concurrent.futures import ThreadPoolExecutor
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import (
     Any,
-    AsyncContextManager,
     Awaitable,
     Callable,
     Collection,
@@ -28,18 +35,26 @@ from typing import (
     Optional,
     Protocol,
     TypeVar,
+    Union,
 )
 from urllib.parse import urlsplit, urlunsplit
 
 import zmq
+import zmq.asyncio
 import zmq.devices
 
 from . import log, remote
 from .buffer import BufferStore
 from .exception import EmergencyStopException
 
-# isort: unique-list
-__all__ = ['Application', 'AsyncProcess', 'AsyncProcessType', 'run_process', 'spin']
+__all__ = [
+    'Application',
+    'AsyncProcess',
+    'AsyncProcessType',
+    'StealingThreadPool',
+    'run_process',
+    'spin',
+]
 
 
 class AsyncProcessType(Protocol):
@@ -95,6 +110,10 @@ class AsyncProcessType(Protocol):
         raise NotImplementedError
 
 
+# Bounds (in seconds) on the interval between attempts to reap an exited child.
+_REAP_INITIAL_DELAY, _REAP_MAX_DELAY = 0.001, 0.1
+
+
 class AsyncProcess(multiprocessing.Process, AsyncProcessType):
     """A subprocess with a callable as an entry point.
 
@@ -105,6 +124,10 @@ class AsyncProcess(multiprocessing.Process, AsyncProcessType):
     a helper task/thread dedicated to blocking on :meth:`multiprocessing.Process.join`
     or polling :meth:`multiprocessing.Process.is_alive`.
 
+    On Linux 5.3 and later, the watched descriptor is a process file descriptor
+    (see :func:`os.pidfd_open`), which the kernel makes readable once the child exits.
+    Elsewhere, :attr:`multiprocessing.Process.sentinel` is watched instead.
+
     Parameters:
         args: Positional arguments to :class:`multiprocessing.Process`.
         kwargs: Keyword arguments to :class:`multiprocessing.Process`. By default, this
@@ -114,27 +137,58 @@ class AsyncProcess(multiprocessing.Process, AsyncProcessType):
     def __init__(self, /, *args: Any, **kwargs: Any) -> None:
         kwargs.setdefault('daemon', True)
         super().__init__(*args, **kwargs)
-        self.exited: Optional[asyncio.Event] = None
+        self.exited: Optional[asyncio.Future[None]] = None
+        self.pidfd: Optional[int] = None
 
     async def wait(self, /) -> Optional[int]:
         if not self.exited:
             raise ValueError('must start process before waiting')
-        await self.exited.wait()
+        # Shield the future so that a cancelled waiter does not cancel the future
+        # shared with other (or later) waiters.
+        await asyncio.shield(self.exited)
         return self.returncode
 
     def _handle_exit(self, /) -> None:
-        asyncio.get_running_loop().remove_reader(self.sentinel)
-        if self.exited:  # pragma: no cover; ``start`` is always called first
-            self.exited.set()
+        if self.pidfd is None:
+            asyncio.get_running_loop().remove_reader(self.sentinel)
+        else:
+            asyncio.get_running_loop().remove_reader(self.pidfd)
+            os.close(self.pidfd)
+            self.pidfd = None
+        # The sentinel becomes ready when the child closes its end, which usually
+        # happens just before the child is reapable (a pidfd is only ready once the
+        # child is). A child may also close the sentinel early (*e.g.*, by closing all
+        # its descriptors) and keep running, so never block the loop on reaping it.
+        self._reap()
+
+    def _reap(self, /, delay: float = _REAP_INITIAL_DELAY) -> None:
+        """Poll until the child is reapable, backing off between attempts."""
+        self.join(timeout=0)
+        if self.exitcode is None:
+            next_delay = min(2 * delay, _REAP_MAX_DELAY)
+            asyncio.get_running_loop().call_later(delay, self._reap, next_delay)
+        else:
+            self._set_exited()
+
+    def _set_exited(self, /) -> None:
+        if self.exited and not self.exited.done():  # pragma: no cover; see ``start``
+            self.exited.set_result(None)
 
     def start(self, /) -> None:
         super().start()
         # All the attributes of a ``multiprocessing.Process`` are apparently pickled
-        # with the 'spawn' start method. Because ``asyncio.Event`` cannot be pickled (it
-        # is attached to the parent process's event loop), we must create the ``exited``
-        # event *after* the process is started.
-        self.exited = asyncio.Event()
-        asyncio.get_running_loop().add_reader(self.sentinel, self._handle_exit)
+        # with the 'spawn' start method. Because a future cannot be pickled (it is
+        # attached to the parent process's event loop), we must create the ``exited``
+        # future *after* the process is started.
+        loop = asyncio.get_running_loop()
+        self.exited = loop.create_future()
+        # Not every platform (or typeshed release) provides ``os.pidfd_open``.
+        pidfd_open: Optional[Callable[[int], int]] = getattr(os, 'pidfd_open', None)
+        watched_fd = self.sentinel
+        if sys.platform == 'linux' and pidfd_open:
+            with contextlib.suppress(OSError):
+                watched_fd = self.pidfd = pidfd_open(typing.cast(int, self.pid))
+        loop.add_reader(watched_fd, self._handle_exit)
 
     @property
     def returncode(self, /) -> Optional[int]:
@@ -144,15 +198,17 @@ class AsyncProcess(multiprocessing.Process, AsyncProcessType):
 async def run_process(
     process: AsyncProcessType,
     *,
+    timeout: Optional[float] = None,
     terminate_timeout: float = 2,
 ) -> Optional[int]:
     """
     Start and wait for a subprocess to exit.
 
     If the task running this function is cancelled in the parent process while the child
-    process has not yet exited, this function will attempt to terminate the child. If
-    the child is not well-behaved and does not terminate by a timeout, this function
-    kills the child, guaranteeing no orphan process left behind.
+    process has not yet exited, or the child runs longer than the timeout, this function
+    will attempt to terminate the child. If the child is not well-behaved and does not
+    terminate by a timeout, this function kills the child, guaranteeing no orphan
+    process left behind.
 
     Once the child is dead, this function also inspects the child's return code to
     determine if it raised an emergency stop. If so, this function re-raises the
@@ -161,6 +217,8 @@ async def run_process(
     Parameters:
         process: The subprocess, which will be started if it is an instance of
             :class:`AsyncProcess` and not yet alive.
+        timeout: Maximum duration (in seconds) to wait for the process to exit on its
+            own. :data:`None` waits indefinitely.
         terminate_timeout: Maximum duration (in seconds) to wait for termination.
 
     Returns:
@@ -177,9 +235,9 @@ async def run_process(
     )
     await logger.info('Process started')
     try:
-        await process.wait()
+        await asyncio.wait_for(process.wait(), timeout)
         await logger.info('Process exited normally', exit_code=process.returncode)
-    except asyncio.CancelledError:
+    except (asyncio.CancelledError, asyncio.TimeoutError):
         try:
             process.terminate()
             await asyncio.wait_for(process.wait(), terminate_timeout)
@@ -194,6 +252,7 @@ async def run_process(
     return process.returncode
 
 
+@functools.lru_cache(maxsize=64)
 def resolve_address(address: str, *, peer: str = '127.0.0.1') -> str:
     """Resolve '*' (all available interfaces in ZMQ) to a concrete address.
 
@@ -218,6 +277,43 @@ def resolve_address(address: str, *, peer: str = '127.0.0.1') -> str:
     return urlunsplit(components)
 
 
+def _prewarm_fd_table(target: int = 4096, /) -> None:
+    """Grow this process's file descriptor table to hold at least ``target`` entries.
+
+    Linux grows the table lazily. The growth can stall the thread that triggers it for
+    tens of milliseconds while RCU synchronizes. Because the kernel never shrinks the
+    table, growing it once before any worker threads open sockets moves that stall to
+    startup. The target is capped by the soft ``RLIMIT_NOFILE`` limit.
+    """
+    soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft_limit != resource.RLIM_INFINITY:
+        target = min(target, soft_limit)
+    if target > 0:
+        with contextlib.suppress(OSError):
+            os.close(fcntl.fcntl(0, fcntl.F_DUPFD_CLOEXEC, target - 1))
+
+
+_IP_MREQ = struct.Struct('4sl')
+
+
+@functools.lru_cache(maxsize=16)
+def _make_membership(host: str, /) -> bytes:
+    """Pack an ``ip_mreq`` structure for joining a multicast group on any interface."""
+    return _IP_MREQ.pack(socket.inet_aton(host), socket.INADDR_ANY)
+
+
+@functools.lru_cache(maxsize=16)
+def _as_connections(address: str, /) -> frozenset[str]:
+    """Wrap a single address as a set of connections, shared across nodes.
+
+    Sharing is safe because the set is immutable.
+    """
+    return frozenset({address})
+
+
+_TRANSPORT_PRIORITY = {'inproc': 0, 'ipc': 1}
+
+
 def get_connection(bindings: Collection[str]) -> str:
     """Find an address to connect to from one or more bound addresses.
 
@@ -225,9 +321,11 @@ def get_connection(bindings: Collection[str]) -> str:
         bindings: ZMQ addresses the peer socket is bound to (URL-like).
 
     Returns:
-        A suitable address to connect to. Address with the ``ipc`` protocol are
-        prioritized over those that require the IP network stack. ``ipc`` is often
-        backed by UNIX domain sockets, which avoid the layering that TCP/IP requires.
+        A suitable address to connect to. Addresses with the ``inproc`` protocol are
+        prioritized first, then ``ipc``, then those that require the IP network stack.
+        ``inproc`` passes messages between threads of the same process without the
+        kernel. ``ipc`` is often backed by UNIX domain sockets, which avoid the layering
+        that TCP/IP requires.
 
     Raises:
         ValueError: If no bindings are provided.
@@ -237,16 +335,30 @@ def get_connection(bindings: Collection[str]) -> str:
         'tcp://127.0.0.1:6000'
         >>> get_connection(['tcp://*:6000', 'ipc:///tmp/rt.sock'])
         'ipc:///tmp/rt.sock'
+        >>> get_connection(['ipc:///tmp/rt.sock', 'inproc://rt'])
+        'inproc://rt'
         >>> get_connection([])
         Traceback (most recent call last):
           ...
         ValueError: must provide at least one address
     """
+    return _get_connection(tuple(bindings))
+
+
+@functools.lru_cache(maxsize=64)
+def _get_connection(bindings: tuple[str, ...]) -> str:
     if not bindings:
         raise ValueError('must provide at least one address')
-    key = lambda address: float('-inf') if address.startswith('ipc') else float('inf')
-    address, *_ = sorted(map(resolve_address, bindings), key=key)
-    return address
+    # Only the winner needs to be resolved. Other transports share the lowest priority.
+    lowest = len(_TRANSPORT_PRIORITY)
+    best_address, best_priority = bindings[0], lowest
+    for address in bindings:
+        priority = _TRANSPORT_PRIORITY.get(address.partition(':')[0], lowest)
+        if priority < best_priority:
+            best_address, best_priority = address, priority
+            if priority == 0:
+                break
+    return resolve_address(best_address)
 
 
 async def spin(
@@ -258,32 +370,277 @@ async def spin(
 ) -> NoReturn:
     """Periodically execute an async callback.
 
+    Each call is scheduled against a deadline computed from the loop's monotonic clock
+    before the call starts, so the period does not drift by the callback's duration.
+
     Parameters:
         func: Async callback.
         args: Positonal arguments to the callback.
-        interval: Duration (in seconds) between calls. The callback is allows to run for
-            longer than the interval. The callback should implement any timeout logic
-            if cancellation is desired.
+        interval: Duration (in seconds) between the starts of consecutive calls. The
+            callback is allowed to run for longer than the interval, in which case the
+            next call starts immediately. The callback should implement any timeout
+            logic if cancellation is desired.
         kwargs: Keyword arguments to the callback.
     """
+    # The arguments never change, so bind them once instead of repacking every call.
+    call: Callable[[], Awaitable[Any]] = func
+    if args or kwargs:
+        call = functools.partial(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
     while True:
-        await asyncio.gather(asyncio.sleep(interval), func(*args, **kwargs))
+        deadline = loop.time() + interval
+        await call()
+        await asyncio.sleep(max(0, deadline - loop.time()))
+
+
+class _ForwarderDevice(zmq.devices.ThreadDevice):
+    """A threaded device that binds before it starts and closes its sockets on exit.
+
+    Unlike :class:`zmq.devices.ThreadDevice`, this device creates its sockets from the
+    given context when constructed, and binds them and sets their options in the calling
+    thread, so peers can connect as soon as :meth:`bind_in` or :meth:`bind_out` returns.
+    (Sockets may migrate to the device thread because starting a thread is a full memory
+    barrier.) Closing the sockets once the context is terminated allows
+    :meth:`zmq.Context.term` to return when the device shares a context with other
+    sockets in this process.
+
+    Parameters:
+        context: The context to create the sockets from.
+        in_type: The socket type of the frontend.
+        out_type: The socket type of the backend.
+        cpus: If set (Linux only), the device thread pins itself to these CPUs so the
+            proxy loop does not migrate between cores on every message.
+    """
+
+    def __init__(
+        self,
+        context: zmq.Context,
+        /,
+        in_type: int,
+        out_type: int,
+        cpus: Optional[frozenset[int]] = None,
+    ) -> None:
+        super().__init__(zmq.FORWARDER, in_type, out_type)
+        self.cpus = cpus
+        self.in_socket = context.socket(in_type)
+        self.out_socket = context.socket(out_type)
+
+    def bind_in(self, addr: str) -> None:
+        self.in_socket.bind(addr)
+
+    def bind_out(self, addr: str) -> None:
+        self.out_socket.bind(addr)
+
+    def setsockopt_in(self, opt: int, value: Union[int, bytes]) -> None:
+        self.in_socket.setsockopt(opt, value)
+
+    def run_device(self, /) -> None:
+        if self.cpus and hasattr(os, 'sched_setaffinity'):
+            # A PID of zero applies the affinity to the calling thread only.
+            with contextlib.suppress(OSError):
+                os.sched_setaffinity(0, self.cpus)
+        try:
+            zmq.proxy(self.in_socket, self.out_socket)
+        finally:
+            self.in_socket.close(linger=0)
+            self.out_socket.close(linger=0)
+
+
+async def _wait_for_subscription(node: remote.SocketNode, /, timeout: float) -> bool:
+    """Wait until a subscription reaches an open ``XPUB`` socket node.
+
+    Unlike a connection handshake, a subscription is observable over every transport
+    (including ``inproc``), and a publisher drops messages until one arrives.
+
+    Returns:
+        Whether a subscription arrived before the timeout.
+    """
+    try:
+        await asyncio.wait_for(node.socket.recv_multipart(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+_zmq_context_lock = threading.Lock()
+_zmq_context_refs = 0  # pylint: disable=invalid-name; a counter, not a constant
+
+
+def _acquire_zmq_context() -> None:
+    """Register a user of the process-wide :class:`zmq.asyncio.Context` instance."""
+    global _zmq_context_refs  # pylint: disable=global-statement,invalid-name
+    with _zmq_context_lock:
+        _zmq_context_refs += 1
+
+
+def _release_zmq_context() -> bool:
+    """Unregister a user of the context, and terminate the context if it was the last.
+
+    Returns:
+        Whether the context was terminated.
+    """
+    global _zmq_context_refs  # pylint: disable=global-statement,invalid-name
+    with _zmq_context_lock:
+        _zmq_context_refs -= 1
+        if _zmq_context_refs > 0:
+            return False
+        zmq.asyncio.Context.instance().term()
+        return True
 
 
 RT = TypeVar('RT')
+WorkItem = tuple[Future[Any], Callable[[], Any]]
 
 
-def enter_async_context(
-    wrapped: Callable[..., Awaitable[AsyncContextManager[RT]]],
-) -> Callable[..., Awaitable[RT]]:
-    """Decorator that adds an async context manager to an async exit stack."""
+class StealingThreadPool(
+    ThreadPoolExecutor
+):  # pylint: disable=too-many-instance-attributes
+    """A thread pool where each worker owns a queue and steals work when idle.
 
-    @functools.wraps(wrapped)
-    async def wrapper(self: 'Application', /, *args: Any, **kwargs: Any) -> RT:
-        resource = await wrapped(self, *args, **kwargs)
-        return await self.stack.enter_async_context(resource)
+    :class:`ThreadPoolExecutor` funnels every submission through a single queue that all
+    workers contend on. Here, each worker has its own :class:`collections.deque` of work
+    items and its own condition variable instead. Submissions made from a worker thread
+    go onto that worker's deque; all other submissions are distributed round-robin. A
+    worker consumes its own deque from the head and, when the deque is empty, steals from
+    the tail of its peers'. A worker with nothing to do sleeps on its condition until a
+    submission wakes it, either because the item is on its deque or because the item's
+    owner is busy and the item is up for stealing.
 
-    return wrapper
+    This class subclasses :class:`ThreadPoolExecutor` only so that :mod:`asyncio` accepts
+    it as a default executor. None of the parent's queueing machinery is used. Like the
+    parent, the pool finishes its remaining work before the interpreter exits, unless it
+    was shut down with ``cancel_futures``.
+
+    Parameters:
+        max_workers: The number of worker threads, all started on the first submission.
+        thread_name_prefix: A prefix for the names of the worker threads.
+    """
+
+    def __init__(self, /, max_workers: int, thread_name_prefix: str = '') -> None:
+        super().__init__(max_workers, thread_name_prefix)
+        # The parent's attributes are an implementation detail, so keep separate state.
+        self._worker_count = max_workers
+        self._name_prefix = thread_name_prefix or f'StealingThreadPool-{id(self):x}'
+        self._lock = threading.Lock()
+        self._closed = False
+        self._deques: list[collections.deque[WorkItem]] = [
+            collections.deque() for _ in range(max_workers)
+        ]
+        self._wakeups = [threading.Condition() for _ in range(max_workers)]
+        self._sleeping = [False] * max_workers
+        self._round_robin = itertools.cycle(range(max_workers))
+        self._local = threading.local()
+        self._workers: list[threading.Thread] = []
+
+    def submit(self, fn: Callable[..., RT], /, *args: Any, **kwargs: Any) -> Future[RT]:
+        if self._closed:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        if not self._workers:
+            self._start_workers()
+        future: Future[RT] = Future()
+        index = getattr(self._local, 'index', None)
+        if index is None:
+            index = next(self._round_robin)
+        item: WorkItem = (future, functools.partial(fn, *args, **kwargs))
+        deque = self._deques[index]
+        deque.append(item)
+        # Workers only exit once every deque is empty after shutdown, so a shutdown
+        # that ran between the check above and the append may have left this item
+        # stranded. Take it back unless a worker has already claimed it.
+        if self._closed:
+            with contextlib.suppress(ValueError):
+                deque.remove(item)
+                raise RuntimeError('cannot schedule new futures after shutdown')
+        self._wake(index)
+        return future
+
+    def _start_workers(self, /) -> None:
+        with self._lock:
+            if self._workers or self._closed:
+                return
+            for index in range(self._worker_count):
+                worker = threading.Thread(
+                    target=self._work,
+                    args=(index,),
+                    name=f'{self._name_prefix}_{index}',
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+            # Daemon threads are killed at exit, so finish outstanding work first. Exit
+            # handlers run before daemon threads are stopped.
+            atexit.register(self.shutdown)
+
+    def _wake(self, index: int, /) -> None:
+        """Wake the owner of a deque or, if the owner is busy, a sleeping peer."""
+        for offset in range(self._worker_count):
+            peer = (index + offset) % self._worker_count
+            # Reading the flag without the lock may miss a worker about to sleep, but
+            # that worker rechecks every deque under its lock before waiting.
+            if self._sleeping[peer]:
+                with self._wakeups[peer]:
+                    if self._sleeping[peer]:
+                        self._wakeups[peer].notify()
+                        return
+
+    def _take(self, index: int, /) -> Optional[WorkItem]:
+        """Pop a work item from this worker's deque, or steal one from a peer."""
+        with contextlib.suppress(IndexError):
+            return self._deques[index].popleft()
+        for offset in range(1, self._worker_count):
+            victim = self._deques[(index + offset) % self._worker_count]
+            with contextlib.suppress(IndexError):
+                return victim.pop()
+        return None
+
+    def _next(self, index: int, /) -> Optional[WorkItem]:
+        """Wait for a work item, or return ``None`` if the pool has shut down."""
+        wakeup = self._wakeups[index]
+        while (item := self._take(index)) is None:
+            with wakeup:
+                self._sleeping[index] = True
+                try:
+                    # Recheck under the lock: a submission that ran after the scan
+                    # above but before the flag was set did not notify this worker.
+                    if (item := self._take(index)) is not None:
+                        return item
+                    if self._closed:
+                        return None
+                    wakeup.wait()
+                finally:
+                    self._sleeping[index] = False
+        return item
+
+    def _work(self, index: int, /) -> None:
+        self._local.index = index
+        while (item := self._next(index)) is not None:
+            future, call = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = call()
+            except BaseException as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._closed = True
+            if cancel_futures:
+                for deque in self._deques:
+                    while deque:
+                        with contextlib.suppress(IndexError):
+                            future, _ = deque.pop()
+                            future.cancel()
+        for wakeup in self._wakeups:
+            with wakeup:
+                wakeup.notify()
+        if wait:
+            for worker in self._workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+        atexit.unregister(self.shutdown)
 
 
 @dataclass
@@ -308,6 +665,8 @@ class Application:
         stack: The stack that the app's resources are pushed on.
         endpoints: A map of endpoint names to endpoints.
         logger: A logger instance (may not be bound).
+        log_forwarder: The log forwarder running in this process, if any.
+        stop_signal: The first stop signal received, if any.
     """
 
     name: str
@@ -315,10 +674,17 @@ class Application:
     stack: contextlib.AsyncExitStack = field(default_factory=contextlib.AsyncExitStack)
     endpoints: dict[str, remote.SocketNode] = field(default_factory=dict)
     logger: log.AsyncLogger = field(default_factory=log.get_logger)
+    log_forwarder: Optional[zmq.devices.ThreadDevice] = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    stop_signal: Optional[int] = field(default=None, init=False, repr=False)
 
     async def __aenter__(self, /) -> 'Application':
         self.configure_loop()
         await self.stack.__aenter__()
+        _acquire_zmq_context()
         self.stack.push_async_callback(self._terminate_zmq_context)
         log.configure(fmt=self.options['log_format'], level=self.options['log_level'])
         return self
@@ -337,14 +703,28 @@ class Application:
         return hide_exc
 
     async def _terminate_zmq_context(self, /) -> None:
-        zmq.asyncio.Context.instance().term()
-        await self.logger.debug('ZMQ context terminated')
+        # ``term`` blocks until every socket is closed, so keep it off the loop.
+        if await asyncio.to_thread(_release_zmq_context):
+            await self.logger.debug('ZMQ context terminated')
+            if self.log_forwarder:
+                # The forwarder's proxy returns once the context is terminated.
+                await asyncio.to_thread(self.log_forwarder.join, 1)
 
     @functools.cached_property
     def executor(self, /) -> ThreadPoolExecutor:
-        """A thread pool executor for running synchronous tasks."""
+        """A thread pool executor for running synchronous tasks.
+
+        The ``thread_pool_kind`` option selects the implementation: ``'default'`` for a
+        plain :class:`ThreadPoolExecutor` or ``'stealing'`` for a
+        :class:`StealingThreadPool`.
+        """
         # pylint: disable=consider-using-with
         # Closed by ``asyncio.AbstractEventLoop.shutdown_default_executor``
+        if self.options.get('thread_pool_kind', 'default') == 'stealing':
+            return StealingThreadPool(
+                self.options['thread_pool_workers'],
+                thread_name_prefix='aioworker',
+            )
         return ThreadPoolExecutor(
             max_workers=self.options['thread_pool_workers'],
             thread_name_prefix='aioworker',
@@ -363,9 +743,14 @@ class Application:
             context['done'] = future.done()
             if isinstance(future, asyncio.Task):
                 context['task_name'] = future.get_name()
-        loop.create_task(
-            asyncio.to_thread(self.logger.sync_bl.error, ctx['message'], **context),
+        log_error = functools.partial(
+            self.logger.sync_bl.error, ctx['message'], **context
         )
+        if 'exc_info' in context:
+            # Formatting a traceback is comparatively expensive, so do so off the loop.
+            loop.run_in_executor(None, log_error)
+        else:
+            log_error()
 
     def configure_loop(self, /) -> None:
         """Configure the current :mod:`asyncio` loop and environment.
@@ -374,7 +759,9 @@ class Application:
           exceptions produced by event loop callbacks.
         * Set the current task and thread names.
         * If this method is called in the main thread, set signal handlers for
-          ``SIGINT`` and ``SIGTERM`` that cancel the current task.
+          ``SIGINT`` and ``SIGTERM`` that cancel the current task. On Linux, also
+          pre-grow the file descriptor table to ``fd_prewarm`` entries (by default,
+          enough for the thread pool's workers plus 1024).
 
         Note:
             This method assumes the current task is the main task run by
@@ -391,16 +778,22 @@ class Application:
             return
         current_task.set_name('main')
         if current_thread is threading.main_thread():
+            if sys.platform == 'linux':
+                default_target = self.options['thread_pool_workers'] * 8 + 1024
+                _prewarm_fd_table(self.options.get('fd_prewarm') or default_target)
             for signum in (signal.SIGINT, signal.SIGTERM):
-                # ``asyncio.run`` will cancel all outstanding tasks and ensure they run
-                # to completion. Cancelling all tasks here, not just the main task,
-                # removes the outstanding tasks from ``asyncio.all_tasks`` and prevents
-                # ``asyncio.run`` from waiting on them.
-                loop.add_signal_handler(
-                    signum,
-                    current_task.cancel,
-                    f'received signal {signum}: {signal.strsignal(signum)}',
-                )
+                loop.add_signal_handler(signum, self._cancel_main, current_task, signum)
+
+    def _cancel_main(self, task: asyncio.Task[Any], signum: int, /) -> None:
+        """Cancel the main task on the first stop signal and ignore later ones.
+
+        ``asyncio.run`` will cancel all outstanding tasks and ensure they run to
+        completion. Cancelling a second time (*e.g.*, when both ``SIGINT`` and
+        ``SIGTERM`` are delivered) would interrupt that cleanup.
+        """
+        if self.stop_signal is None:
+            self.stop_signal = signum
+            task.cancel(f'received signal {signum}: {signal.strsignal(signum)}')
 
     async def _health_cb(self, /) -> None:
         await self.logger.info(
@@ -416,39 +809,107 @@ class Application:
             name='report-health',
         )
 
-    async def make_log_forwarder(self, /) -> zmq.devices.Device:
+    def _get_log_connection(self, /, side: str) -> str:
+        """Find an address to connect to the log forwarder's frontend or backend.
+
+        If the forwarder runs in this process, the ``inproc`` transport is preferred.
+        """
+        addresses = list(self.options[f'log_{side}'])
+        if self.log_forwarder:
+            addresses.append(f'inproc://{self.name}-log-{side}')
+        return get_connection(addresses)
+
+    # The log connections are not cached on the instance because they change once a
+    # log forwarder starts in this process. ``get_connection`` is cached instead.
+    @property
+    def log_backend_conn(self, /) -> str:
+        """The address log publishers connect to."""
+        return self._get_log_connection('backend')
+
+    @property
+    def log_frontend_conn(self, /) -> str:
+        """The address log subscribers connect to."""
+        return self._get_log_connection('frontend')
+
+    @functools.cached_property
+    def router_frontend_conn(self, /) -> str:
+        """The address clients connect to."""
+        return get_connection(self.options['router_frontend'])
+
+    @functools.cached_property
+    def router_backend_conn(self, /) -> str:
+        """The address services connect to."""
+        return get_connection(self.options['router_backend'])
+
+    @functools.cached_property
+    def client_node_options(self, /) -> dict[int, Union[int, bytes]]:
+        """The socket options of default client nodes (copy before use)."""
+        options = dict(self.options['client_option'])
+        options.setdefault(zmq.IDENTITY, f'{self.name}-client'.encode())
+        return options
+
+    @functools.cached_property
+    def service_node_options(self, /) -> dict[int, Union[int, bytes]]:
+        """The socket options of default service nodes (copy before use)."""
+        options = dict(self.options['service_option'])
+        options.setdefault(zmq.IDENTITY, f'{self.name}-service'.encode())
+        return options
+
+    async def make_log_forwarder(self, /) -> zmq.devices.ThreadDevice:
         """Make a threaded device that forwards ZMQ PUB-SUB messages emitted by loggers.
 
         The device is subscribed to all messages. Both sockets bind to fixed addresses.
+        Where supported, the device thread is pinned to the highest available CPU. The
+        device shares this process's ZMQ context and also binds to ``inproc`` addresses,
+        so that publishers and subscribers in this process can bypass the kernel.
         """
-        forwarder = zmq.devices.ThreadDevice(zmq.FORWARDER, zmq.SUB, zmq.PUB)
+        ctx = zmq.Context.shadow(zmq.asyncio.Context.instance().underlying)
+        cpus = None
+        if hasattr(os, 'sched_getaffinity'):
+            # Keep the application's other threads on the lower-numbered CPUs.
+            cpus = frozenset({max(os.sched_getaffinity(0))})
+        forwarder = _ForwarderDevice(ctx, zmq.SUB, zmq.PUB, cpus=cpus)
         for address in self.options['log_backend']:
             forwarder.bind_in(address)
         for address in self.options['log_frontend']:
             forwarder.bind_out(address)
+        forwarder.bind_in(f'inproc://{self.name}-log-backend')
+        forwarder.bind_out(f'inproc://{self.name}-log-frontend')
         forwarder.setsockopt_in(zmq.SUBSCRIBE, b'')
         forwarder.start()
-        await asyncio.sleep(0.05)
+        self.log_forwarder = forwarder
         return forwarder
 
-    async def make_log_publisher(self, /) -> log.LogPublisher:
+    async def make_log_publisher(self, /, timeout: float = 1) -> log.LogPublisher:
         """Make a client that connects to the log forwarder's backend socket.
 
-        The publisher will be installed in the processor chain.
+        The publisher will be installed in the processor chain once the forwarder's
+        subscription has reached it, so that early events are not dropped. The
+        publisher's ``XPUB`` socket receives the subscription over any transport.
+
+        Parameters:
+            timeout: The maximum duration (in seconds) to wait for the subscription. If
+                the forwarder has not subscribed by then (*e.g.*, because it has not
+                started yet), the publisher is installed anyway and a warning is logged.
         """
         # pylint: disable=unexpected-keyword-arg; dataclass not recognized
         node = remote.SocketNode(
-            socket_type=zmq.PUB,
-            connections=frozenset({get_connection(self.options['log_backend'])}),
+            socket_type=zmq.XPUB,
+            connections=_as_connections(self.log_backend_conn),
         )
         publisher = await self.stack.enter_async_context(log.LogPublisher(node))
-        await asyncio.sleep(0.05)
+        subscribed = await _wait_for_subscription(node, timeout)
         log.configure(
             publisher,
             fmt=self.options['log_format'],
             level=self.options['log_level'],
         )
         self.logger = self.logger.bind(app=self.name)
+        if not subscribed:
+            await self.logger.warn(
+                'Log forwarder did not subscribe in time; events may be dropped',
+                timeout=timeout,
+            )
         await self.logger.info(
             'Log publisher configured',
             fmt=self.options['log_format'],
@@ -471,12 +932,11 @@ class Application:
         subs = {level for level in log.LEVELS if log.get_level_num(level) >= min_level}
         node = remote.SocketNode(
             socket_type=zmq.SUB,
-            connections=frozenset({get_connection(self.options['log_frontend'])}),
+            connections=_as_connections(self.log_frontend_conn),
             subscriptions=subs,
         )
         return await self.make_service(handler, node, logger=log.get_null_logger())
 
-    @enter_async_context
     async def make_client(self, /, node: Optional[remote.Node] = None) -> remote.Client:
         """Make and start a remote call client.
 
@@ -489,17 +949,14 @@ class Application:
         name = f'{self.name}-client'
         if not node:
             # pylint: disable=unexpected-keyword-arg; dataclass not recognized
-            options = dict(self.options['client_option'])
-            options.setdefault(zmq.IDENTITY, name.encode())
-            connection = get_connection(self.options['router_frontend'])
             node = remote.SocketNode(
                 socket_type=zmq.DEALER,
-                connections=frozenset({connection}),
-                options=options,
+                connections=_as_connections(self.router_frontend_conn),
+                options=self.client_node_options.copy(),
             )
-        return remote.Client(node, logger=self.logger.bind(name=name))
+        client = remote.Client(node, logger=self.logger.bind(name=name))
+        return await self.stack.enter_async_context(client)
 
-    @enter_async_context
     async def make_service(
         self,
         /,
@@ -520,20 +977,19 @@ class Application:
         name = f'{self.name}-service'
         if not node:
             # pylint: disable=unexpected-keyword-arg; dataclass not recognized
-            options = dict(self.options['service_option'])
-            options.setdefault(zmq.IDENTITY, name.encode())
             node = remote.SocketNode(
                 socket_type=zmq.DEALER,
-                connections=frozenset({get_connection(self.options['router_backend'])}),
-                options=options,
+                connections=_as_connections(self.router_backend_conn),
+                options=self.service_node_options.copy(),
             )
         logger = logger or self.logger
-        return remote.Service(
+        service = remote.Service(
             node=node,
             handler=handler,
             concurrency=self.options['service_workers'],
             logger=logger.bind(name=name),
         )
+        return await self.stack.enter_async_context(service)
 
     async def make_update_client(self, /) -> remote.Client:
         """Make a client for publishing Smart Device updates over UDP/IP multicast.
@@ -574,7 +1030,7 @@ class Application:
             bits. (The first parameters correspond to the lower-order bits.)
         """
         node = remote.DatagramNode.from_address(self.options['update_addr'], bind=True)
-        membership = struct.pack('4sl', socket.inet_aton(node.host), socket.INADDR_ANY)
+        membership = _make_membership(node.host)
         node.options = {
             (socket.SOL_SOCKET, socket.SO_BROADCAST, 1),
             (socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1),
@@ -609,13 +1065,13 @@ class Application:
         node = remote.DatagramNode.from_address(self.options['control_addr'], bind=True)
         return await self.make_service(handler, node)
 
-    @enter_async_context
     async def make_router(self, /) -> remote.Router:
         """Make a router for passing remote call requests and responses."""
-        return remote.Router.bind(
+        router = remote.Router.bind(
             self.options['router_frontend'],
             self.options['router_backend'],
         )
+        return await self.stack.enter_async_context(router)
 
     def make_buffer_manager(self, /, *, shared: bool = True) -> BufferStore:
         """Make a buffer manager.
@@ -22,24 +22,20 @@ transport.
 
 import abc
 import asyncio
+import collections
 import contextlib
 import enum
 import functools
 import inspect
+import io
 import random
 import socket
+import threading
 import types
 import typing
-from collections.abc import (
-    AsyncIterator,
-    Awaitable,
-    Callable,
-    Collection,
-    Iterator,
-    MutableMapping,
-)
+from collections.abc import Awaitable, Callable, Collection, Iterator, MutableMapping
 from dataclasses import dataclass, field
-from typing import Any, Generic, NoReturn, Optional, Protocol, TypeVar, Union
+from typing import Any, ClassVar, Generic, NoReturn, Optional, Protocol, TypeVar, Union
 from urllib.parse import urlsplit
 
 import cbor2
@@ -92,6 +88,29 @@ class MessageType(enum.IntEnum):
     NOTIFICATION = 2
 
 
+_MESSAGE_TYPES: dict[Any, MessageType] = {type_.value: type_ for type_ in MessageType}
+
+
+def _get_message_type(value: Any, /) -> MessageType:
+    """Look up a message type by value, like :class:`MessageType` but faster.
+
+    Raises:
+        ValueError: If the value is not a message type.
+
+    Examples:
+        >>> _get_message_type(2)
+        <MessageType.NOTIFICATION: 2>
+        >>> _get_message_type([])
+        Traceback (most recent call last):
+          ...
+        ValueError: [] is not a valid MessageType
+    """
+    try:
+        return _MESSAGE_TYPES[value]
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f'{value!r} is not a valid MessageType') from exc
+
+
 Segments = tuple[list[bytes], Any]
 NodeType = TypeVar('NodeType', bound='Node')
 EndpointType = TypeVar('EndpointType', bound='Endpoint')
@@ -108,6 +127,71 @@ def get_logger(*factory_args: Any, **context: Any) -> structlog.stdlib.AsyncBoun
     return typing.cast(structlog.stdlib.AsyncBoundLogger, logger)
 
 
+class _RecvQueue:
+    """A bounded FIFO of received messages that a message can be returned to.
+
+    This implements the subset of the :class:`asyncio.Queue` interface that nodes use,
+    plus :meth:`requeue`. Receivers never wait on the queue itself (:meth:`Node.recv`
+    registers a waiter instead), so only producers block, until a message is removed.
+
+    Attributes:
+        maxsize: The number of messages at which :meth:`put` blocks. Zero or fewer
+            means the queue is unbounded.
+    """
+
+    def __init__(self, maxsize: int = 0, /) -> None:
+        self.maxsize = maxsize
+        self._items: collections.deque[Segments] = collections.deque()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+
+    def qsize(self, /) -> int:
+        """The number of messages in the queue."""
+        return len(self._items)
+
+    def empty(self, /) -> bool:
+        """Whether the queue holds no messages."""
+        return not self._items
+
+    def full(self, /) -> bool:
+        """Whether :meth:`put` would block."""
+        return 0 < self.maxsize <= len(self._items)
+
+    async def put(self, item: Segments, /) -> None:
+        """Append a message, waiting until the queue has room."""
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._items.append(item)
+
+    def put_nowait(self, item: Segments, /) -> None:
+        """Append a message.
+
+        Raises:
+            asyncio.QueueFull: If the queue has no room.
+        """
+        if self.full():
+            raise asyncio.QueueFull
+        self._items.append(item)
+
+    def get_nowait(self, /) -> Segments:
+        """Remove and return the oldest message.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue holds no messages.
+        """
+        if not self._items:
+            raise asyncio.QueueEmpty
+        item = self._items.popleft()
+        if not self.full():
+            self._not_full.set()
+        return item
+
+    def requeue(self, item: Segments, /) -> None:
+        """Return a message to the head of the queue, even if the queue is full."""
+        self._items.appendleft(item)
+
+
 @dataclass  # type: ignore[misc]
 class Node(abc.ABC):  # https://github.com/python/mypy/issues/5374
     """A transceiver of discrete binary messages.
@@ -130,12 +214,22 @@ class Node(abc.ABC):  # https://github.com/python/mypy/issues/5374
     node works with.
 
     Attributes:
+        recv_queue: Received messages that no :meth:`recv` caller was waiting for.
+            Producers must pass messages through :meth:`_deliver` first and only
+            enqueue those it declines. Putting a message directly onto the queue would
+            strand receivers already waiting on :attr:`recv_waiters`.
+        recv_waiters: Futures of :meth:`recv` callers waiting for a message.
         send_count: The number of messages sent since the transport was opened.
         recv_count: The number of messages received since the transport was opened.
     """
 
-    recv_queue: asyncio.Queue[Segments] = field(
-        default_factory=lambda: asyncio.Queue(128),
+    recv_queue: _RecvQueue = field(
+        default_factory=lambda: _RecvQueue(128),
+        init=False,
+        repr=False,
+    )
+    recv_waiters: collections.deque[asyncio.Future[Segments]] = field(
+        default_factory=collections.deque,
         init=False,
         repr=False,
     )
@@ -165,12 +259,15 @@ class Node(abc.ABC):  # https://github.com/python/mypy/issues/5374
         /,
         *,
         address: Optional[Any] = None,
+        block: bool = True,
     ) -> None:
         """Send a message.
 
         Parameters:
             parts: Zero or more data segments.
             address: The destination's address.
+            block: Whether to wait until the message can be queued. Transports that
+                never wait ignore this flag.
 
         Raises:
             RemoteCallError: If the transport cannot send the message. May reopen the
@@ -192,10 +289,68 @@ class Node(abc.ABC):  # https://github.com/python/mypy/issues/5374
         """
         if not self.can_recv:
             raise RemoteCallError('transport does not support recv')
-        item = await self.recv_queue.get()
+        item: Segments
+        if self.recv_queue.empty():
+            waiter: asyncio.Future[
+                Segments
+            ] = asyncio.get_running_loop().create_future()
+            self.recv_waiters.append(waiter)
+            try:
+                item = await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The message was handed off just before the cancellation. While
+                    # any receiver is waiting, the queue is empty, so either pass the
+                    # message on or put it back ahead of newer messages.
+                    item = waiter.result()
+                    if not self._deliver(item):
+                        self.recv_queue.requeue(item)
+                else:
+                    waiter.cancel()
+                    # ``_deliver`` may have already discarded the cancelled waiter.
+                    with contextlib.suppress(ValueError):
+                        self.recv_waiters.remove(waiter)
+                raise
+        else:
+            item = self.recv_queue.get_nowait()
         self.recv_count += 1
         return item
 
+    async def recv_batch(self, /, max_count: int = 32) -> list[Segments]:
+        """Receive one message, then any messages already buffered, without waiting.
+
+        Parameters:
+            max_count: The maximum number of messages to return.
+
+        Returns:
+            Between one and ``max_count`` messages, in the order they were received.
+
+        Raises:
+            RemoteCallError: If the transport cannot receive a message.
+        """
+        batch = [await self.recv()]
+        with contextlib.suppress(asyncio.QueueEmpty):
+            while len(batch) < max_count:
+                batch.append(self.recv_queue.get_nowait())
+        self.recv_count += len(batch) - 1
+        return batch
+
+    def _deliver(self, item: Segments, /) -> bool:
+        """Hand a received message to the longest-waiting :meth:`recv` caller.
+
+        Waking a waiter directly bypasses :attr:`recv_queue`, whose ``put``/``get`` pair
+        costs more than the handoff itself when the queue is empty (the common case).
+
+        Returns:
+            Whether a waiter took the message. If not, the caller should enqueue it.
+        """
+        while self.recv_waiters:
+            waiter = self.recv_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(item)
+                return True
+        return False
+
     @abc.abstractmethod
     async def open(self, /) -> None:
         """Open the internal transport."""
@@ -214,30 +369,26 @@ class Node(abc.ABC):  # https://github.com/python/mypy/issues/5374
     def can_recv(self, /) -> bool:
         """Whether the transport can receive messages."""
 
-    @contextlib.asynccontextmanager
-    async def _maybe_reopen(
-        self,
-        /,
-        *exc_types: type[Exception],
-    ) -> AsyncIterator[None]:
-        """An async context manager for reopening the transport when an error occurs.
+    def _check_open(self, /) -> None:
+        """Raise :class:`RemoteCallError` if the transport is closed."""
+        if self.closed:
+            raise RemoteCallError('transport is closed')
+
+    async def _reopen(self, exc: Exception, /) -> NoReturn:
+        """Reopen the transport after an error occurs.
+
+        Callers catch transport errors inline rather than through an async context
+        manager, which would cost more than a typical send.
 
         Parameters:
-            exc_types: Exception types to catch. If none are given, defaults to
-                :class:`Exception`.
+            exc: The error that caused the transport to be reopened.
 
         Raises:
-            RemoteCallError: If the transport is reopened.
+            RemoteCallError: Always, chained to the error.
         """
-        if self.closed:
-            raise RemoteCallError('transport is closed')
-        exc_types = exc_types or (Exception,)
-        try:
-            yield
-        except exc_types as exc:
-            self.close()
-            await self.open()
-            raise RemoteCallError('node transport reopened') from exc
+        self.close()
+        await self.open()
+        raise RemoteCallError('node transport reopened') from exc
 
 
 SocketOptionType = tuple[int, int, Union[int, bytes]]
@@ -266,8 +417,10 @@ class DatagramNode(Node, asyncio.DatagramProtocol):
     )
 
     def datagram_received(self, data: bytes, addr: Any, /) -> None:
-        with contextlib.suppress(asyncio.QueueFull):
-            self.recv_queue.put_nowait(([data], addr))
+        item = [data], addr
+        if not self._deliver(item):
+            with contextlib.suppress(asyncio.QueueFull):
+                self.recv_queue.put_nowait(item)
 
     def connection_lost(self, exc: Optional[Exception], /) -> None:
         self.close()
@@ -278,12 +431,17 @@ class DatagramNode(Node, asyncio.DatagramProtocol):
         /,
         *,
         address: Optional[tuple[str, int]] = None,
+        block: bool = True,
     ) -> None:
+        # pylint: disable=unused-argument; sending a datagram never waits
         if not self.transport:
             raise RemoteCallError('transport is not yet open')
-        async with self._maybe_reopen():
+        self._check_open()
+        try:
             for part in parts:
                 self.transport.sendto(part, addr=address)
+        except OSError as exc:
+            await self._reopen(exc)
         self.send_count += 1
 
     async def open(self, /) -> None:
@@ -342,6 +500,9 @@ class DatagramNode(Node, asyncio.DatagramProtocol):
         )
 
 
+_PUB_TYPES = frozenset({zmq.PUB, zmq.XPUB})
+
+
 @dataclass
 class SocketNode(Node):
     """A wrapper around :class:`zmq.asyncio.Socket` for handling timeouts.
@@ -398,22 +559,49 @@ class SocketNode(Node):
         /,
         *,
         address: Optional[bytes] = None,
+        block: bool = True,
     ) -> None:
+        """Send a message.
+
+        Parameters:
+            parts: Zero or more data segments.
+            address: The destination's address.
+            block: Whether to wait until the message can be queued. A blocking send
+                that times out reopens the transport.
+
+        Raises:
+            RemoteCallError: If the transport cannot send the message.
+            zmq.error.Again: If the send would block and ``block`` is false. The
+                transport is not reopened.
+        """
         if not address:
             raise RemoteCallError('must provide an address')
-        async with self._maybe_reopen(zmq.error.Again):
-            await self.socket.send_multipart([address, *parts])
+        self._check_open()
+        flags = 0 if block else zmq.DONTWAIT
+        try:
+            # pyzmq still copies frames under ``zmq.COPY_THRESHOLD`` (where copying is
+            # cheaper than tracking the buffer), but sends larger frames without copying.
+            await self.socket.send_multipart([address, *parts], flags, copy=False)
+        except zmq.error.Again as exc:
+            if not block:
+                raise
+            await self._reopen(exc)
         self.send_count += 1
 
     async def _recv_forever(self, /) -> NoReturn:
         """Receive messages indefinitely and enqueue them."""
         while True:
             with contextlib.suppress(RemoteCallError):
-                async with self._maybe_reopen(zmq.error.Again):
+                self._check_open()
+                try:
                     sender_id, *frames = await self.socket.recv_multipart()
                     if self.socket_type == zmq.SUB:
                         sender_id = b''
-                    await self.recv_queue.put((list(frames), sender_id))
+                    item = frames, sender_id
+                    if not self._deliver(item):
+                        await self.recv_queue.put(item)
+                except zmq.error.Again as exc:
+                    await self._reopen(exc)
 
     async def open(self, /) -> None:
         ctx = zmq.asyncio.Context.instance()
@@ -440,7 +628,8 @@ class SocketNode(Node):
 
     @property
     def can_recv(self, /) -> bool:
-        return self.socket_type != zmq.PUB
+        # An ``XPUB`` socket only receives subscriptions, which are not messages.
+        return self.socket_type not in _PUB_TYPES
 
     def subscribe(self, /, topic: str = '') -> None:
         """Subscribe to a topic (for ``zmq.SUB`` sockets only).
@@ -483,22 +672,208 @@ def _check_type(node: Node, /, *allowed_types: int) -> None:
         )
 
 
-async def _encode(obj: Any, /) -> bytes:
-    """Encode an object as a CBOR-encoded buffer in the default executor.
+INLINE_CODEC_THRESHOLD: int = 4096
+"""The size (in bytes) up to which messages are encoded/decoded on the event loop.
+
+Larger messages are (de)serialized in the default executor, where the cost of the
+executor round trip is small compared to the blocking time it saves the loop.
+"""
+
+
+def _remaining_budget(obj: Any, budget: int, /) -> int:
+    """Subtract an upper bound on an object's CBOR-encoded size from a budget.
+
+    Traversal stops once the budget is exhausted, so the cost of estimating is bounded
+    by the budget, not by the object's size. Any type without a cheap bound (*e.g.*, a
+    set, a dataclass, or a value encoded with a semantic tag) exhausts the budget.
+
+    Examples:
+        >>> _remaining_budget(['add', [1, 2]], 100)
+        43
+        >>> _remaining_budget([b'x' * 100, [1, 2]], 100) < 0
+        True
+        >>> _remaining_budget({1, 2}, 100) < 0
+        True
+    """
+    if isinstance(obj, str):
+        budget -= 4 * len(obj) + 9
+    elif isinstance(obj, (bytes, bytearray)):
+        budget -= len(obj) + 9
+    elif isinstance(obj, (list, tuple)):
+        budget -= 9
+        for item in obj:
+            if budget < 0:
+                break
+            budget = _remaining_budget(item, budget)
+    elif isinstance(obj, dict):
+        budget -= 9
+        for key, value in obj.items():
+            if budget < 0:
+                break
+            budget = _remaining_budget(value, _remaining_budget(key, budget))
+    elif obj is None or isinstance(obj, bool):
+        budget -= 1
+    elif isinstance(obj, float) or (
+        isinstance(obj, int) and -(2 ** 64) <= obj < 2 ** 64
+    ):
+        budget -= 9
+    else:
+        budget = -1
+    return budget
+
+
+class _Codec(threading.local):
+    """A per-thread CBOR encoder and decoder.
+
+    :func:`cbor2.dumps` and :func:`cbor2.loads` construct a new stream and
+    encoder/decoder on every call, which costs more than (de)serializing a typical
+    message. Both objects reset their state between top-level values, so they can be
+    reused, but not shared across threads.
+    """
+
+    def __init__(self, /) -> None:
+        super().__init__()
+        self.buffer = io.BytesIO()
+        self.encoder = cbor2.CBOREncoder(self.buffer)
+        self.decoder = cbor2.CBORDecoder(io.BytesIO())
+
+    def _reset(self, /) -> None:
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+    def dumps_call(
+        self,
+        method: str,
+        args: Any,
+        /,
+        message_id: Optional[int] = None,
+    ) -> bytes:
+        """Encode a request, or a notification if no message ID is given.
+
+        The output is identical to encoding the message as a list, but the constant
+        header and method name are spliced in from precomputed bytes. They are written
+        through the encoder, so the stream stays ordered even if the encoder buffers.
+        """
+        self._reset()
+        if message_id is None:
+            self.encoder.write(_NOTIFICATION_HEADER)
+        else:
+            self.encoder.write(_REQUEST_HEADER)
+            self.encoder.encode(message_id)
+        self.encoder.write(_encode_method(method))
+        self.encoder.encode(args)
+        return self.buffer.getvalue()
+
+    def dumps_response(self, message_id: Any, error: Any, result: Any, /) -> bytes:
+        """Encode a response, like :meth:`dumps_call`."""
+        self._reset()
+        self.encoder.write(_RESPONSE_HEADER)
+        self.encoder.encode(message_id)
+        self.encoder.encode(error)
+        self.encoder.encode(result)
+        return self.buffer.getvalue()
+
+    def loads(self, buf: bytes, /) -> Any:
+        """Decode a CBOR-encoded buffer."""
+        return self.decoder.decode_from_bytes(buf)
+
+
+# Array headers (``0x80`` ORed with the length) followed by the encoded message type.
+_REQUEST_HEADER = b'\x84' + cbor2.dumps(MessageType.REQUEST.value)
+_NOTIFICATION_HEADER = b'\x83' + cbor2.dumps(MessageType.NOTIFICATION.value)
+_RESPONSE_HEADER = b'\x84' + cbor2.dumps(MessageType.RESPONSE.value)
+_codec = _Codec()
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_method(method: str, /) -> bytes:
+    return cbor2.dumps(method)
+
+
+async def _encode_call(
+    method: str,
+    args: Any,
+    /,
+    message_id: Optional[int] = None,
+) -> bytes:
+    """Encode a request or notification.
+
+    Small messages are encoded inline. Large messages are encoded in the default
+    executor.
+
+    Raises:
+        cbor2.CBOREncodeError: If the encoding fails.
+    """
+    if _remaining_budget(args, INLINE_CODEC_THRESHOLD) >= 0:
+        return _codec.dumps_call(method, args, message_id)
+    return await asyncio.to_thread(_codec.dumps_call, method, args, message_id)
+
+
+async def _encode_response(message_id: Any, error: Any, result: Any, /) -> bytes:
+    """Encode a response like :func:`_encode_call`.
 
     Raises:
         cbor2.CBOREncodeError: If the encoding fails.
     """
-    return await asyncio.to_thread(cbor2.dumps, obj)
+    if _remaining_budget(result, INLINE_CODEC_THRESHOLD) >= 0:
+        return _codec.dumps_response(message_id, error, result)
+    return await asyncio.to_thread(_codec.dumps_response, message_id, error, result)
 
 
 async def _decode(buf: bytes, /) -> Any:
-    """Decode a CBOR-encoded buffer in the default executor.
+    """Decode a CBOR-encoded buffer.
+
+    Small buffers are decoded inline. Large buffers are decoded in the default executor.
 
     Raises:
         cbor2.CBORDecodeError: If the decoding fails.
     """
-    return await asyncio.to_thread(cbor2.loads, buf)
+    if len(buf) <= INLINE_CODEC_THRESHOLD:
+        return _codec.loads(buf)
+    return await asyncio.to_thread(_codec.loads, buf)
+
+
+ResultType = TypeVar('ResultType')
+
+
+async def _wait_for(awaitable: Awaitable[ResultType], timeout: float, /) -> ResultType:
+    """Like :func:`asyncio.wait_for`, but with less overhead.
+
+    :func:`asyncio.wait_for` allocates a waiter future and several callbacks on every
+    call. This function only schedules a timer that cancels the awaitable (wrapped in a
+    task, if it is a coroutine). The caller also resumes as soon as the awaitable is
+    done, rather than one event loop iteration later.
+
+    Cancelling the caller cancels the awaitable and raises
+    :class:`asyncio.CancelledError`, even when the timeout has already expired and the
+    awaitable is still unwinding. (Before Python 3.11, which added
+    :meth:`asyncio.Task.cancelling`, such a cancellation cannot be told apart from the
+    timeout and raises :class:`asyncio.TimeoutError` instead.)
+
+    Raises:
+        asyncio.TimeoutError: If the awaitable did not complete in time.
+    """
+    future = asyncio.ensure_future(awaitable)
+    expired = False
+
+    def expire() -> None:
+        nonlocal expired
+        expired = True
+        future.cancel()
+
+    timer = asyncio.get_running_loop().call_later(timeout, expire)
+    try:
+        return await future
+    except asyncio.CancelledError as exc:
+        # The caller only resumes once the awaitable is done, even when the caller
+        # itself was cancelled, so also check for a pending cancellation request.
+        cancelling = getattr(asyncio.current_task(), 'cancelling', None)
+        if expired and future.done() and not (cancelling and cancelling()):
+            raise asyncio.TimeoutError from exc
+        future.cancel()
+        raise
+    finally:
+        timer.cancel()
 
 
 Method = Callable[..., Any]
@@ -564,6 +939,9 @@ class Endpoint(abc.ABC):  # https://github.com/python/mypy/issues/5374
         node: The message transceiver. Not all node/endpoint pairs are compatible.
         concurrency: The number of workers.
         logger: A logger instance.
+        batch_size: The maximum number of buffered messages a worker takes from the
+            node at once. Messages in a batch are processed sequentially by one worker,
+            so batching only suits endpoints that process messages quickly.
     """
 
     node: Node
@@ -574,6 +952,7 @@ class Endpoint(abc.ABC):  # https://github.com/python/mypy/issues/5374
         init=False,
         repr=False,
     )
+    batch_size: int = 1
 
     def __post_init__(self, /) -> None:
         if self.concurrency < 0:
@@ -599,13 +978,18 @@ class Endpoint(abc.ABC):  # https://github.com/python/mypy/issues/5374
     async def _process_forever(self, /, *, cooldown: float = 0.01) -> NoReturn:
         """Receive messages indefinitely and process them."""
         logger = self.logger.bind()
+        batch: collections.deque[Segments] = collections.deque()
         while True:
             try:
-                frames, address = await self.node.recv()
+                if not batch:
+                    batch.extend(await self.node.recv_batch(self.batch_size))
+                frames, address = batch.popleft()
                 payload, *_ = frames
                 message_type, *message = await _decode(payload)
-                message_type = MessageType(message_type)
-                await logger.debug(
+                message_type = _get_message_type(message_type)
+                # Per-message debug events are usually filtered out. Log synchronously,
+                # since the async logger hops to a thread even to drop an event.
+                logger.sync_bl.debug(
                     'Endpoint received message', message_type=message_type.name
                 )
                 await self.handle_message(address, message_type, *message)
@@ -641,6 +1025,10 @@ class RequestTracker(Generic[ResponseType]):
     Every request is associated with a unique request ID (an integer, or an object
     serializable as an integer).
 
+    Generated IDs count up from a random offset, so they cannot repeat until the ID
+    space wraps around. The random offset makes it unlikely that IDs match stale
+    responses addressed to a previous tracker (*e.g.*, before a client restarted).
+
     Parameters:
         futures: A mapping from request IDs to futures representing responses.
         lower: Minimum valid request ID.
@@ -652,13 +1040,20 @@ class RequestTracker(Generic[ResponseType]):
     )
     lower: int = 0
     upper: int = (1 << 32) - 1
+    offset: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self, /) -> None:
+        self.offset = random.randrange(self.upper - self.lower + 1)
 
     def _try_generate_id(self, /) -> int:
         """Attempt to generate a request ID.
 
         Unlike :meth:`generate_uid`, the candidate ID does not need to be unique.
         """
-        return random.randint(self.lower, self.upper)
+        self.offset += 1
+        if self.offset > self.upper - self.lower:
+            self.offset = 0
+        return self.lower + self.offset
 
     def generate_uid(self, /, *, attempts: int = 10) -> int:
         """Generate a unique request ID.
@@ -688,7 +1083,7 @@ class RequestTracker(Generic[ResponseType]):
 
         Parameters:
             request_id: A unique request identifier. If not provided, a request ID is
-                randomly generated.
+                generated.
 
         Returns:
             The request ID and a future representing the outcome of the request.
@@ -731,24 +1126,24 @@ class CallFactory:
     A wrapper class around the call factory.
 
     This wrapper uses currying to partially complete the argument list to
-    :meth:`Client.issue_call`.
+    :meth:`Client.issue_call`. Curried calls are cached by method name in a dictionary,
+    which is emptied once it holds :attr:`max_cached_calls` entries.
     """
 
     issue_call: Call
-    cached_partial: Callable[[str], Call] = field(init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        make_cached = functools.lru_cache(maxsize=128)
-        self.cached_partial: Callable[[str], Call] = make_cached(self._partial)
-
-    def _partial(self, method: str) -> Call:
-        return functools.partial(self.issue_call, method)
+    calls: dict[str, Call] = field(default_factory=dict, init=False, repr=False)
+    max_cached_calls: ClassVar[int] = 128
 
     def __getitem__(self, method: str) -> Call:
-        return self.cached_partial(method)
+        call = self.calls.get(method)
+        if call is None:
+            if len(self.calls) >= self.max_cached_calls:
+                self.calls.clear()
+            call = self.calls[method] = functools.partial(self.issue_call, method)
+        return call
 
     def __getattr__(self, method: str) -> Call:
-        return self.cached_partial(method)
+        return self[method]
 
 
 @dataclass
@@ -763,12 +1158,15 @@ class Client(Endpoint):
             outcome of a call (a result or an exception).
         node: A node for transporting messages.
         concurrency: The number of workers for processing responses.
+        batch_size: Resolving a response is cheap, so workers take responses in
+            batches by default.
     """
 
     requests: RequestTracker[Any] = field(default_factory=RequestTracker)
+    batch_size: int = 32
 
     def __post_init__(self, /) -> None:
-        _check_type(self.node, zmq.PUB, zmq.DEALER)
+        _check_type(self.node, *_PUB_TYPES, zmq.DEALER)
         if not self.node.can_recv:
             self.concurrency = 0
         super().__post_init__()
@@ -830,21 +1228,22 @@ class Client(Endpoint):
         """
         if not self.node.can_recv:
             notification = True
-        if isinstance(self.node, SocketNode) and self.node.socket_type == zmq.PUB:
+        if isinstance(self.node, SocketNode) and self.node.socket_type in _PUB_TYPES:
             address = address or method.encode()
-        await self.logger.debug(
+        # See ``Endpoint._process_forever`` for why this event is logged synchronously.
+        self.logger.sync_bl.debug(
             'Issuing remote procedure call',
             method=method,
             notification=notification,
         )
         if notification:
-            request = [MessageType.NOTIFICATION.value, method, args]
-            await self.node.send([await _encode(request)], address=address)
+            request = await _encode_call(method, args)
+            await self.node.send([request], address=address)
         else:
             with self.requests.new_request() as (message_id, result):
-                request = [MessageType.REQUEST.value, message_id, method, args]
-                await self.node.send([await _encode(request)], address=address)
-                return await asyncio.wait_for(result, timeout)
+                request = await _encode_call(method, args, message_id)
+                await self.node.send([request], address=address)
+                return await _wait_for(result, timeout)
 
     @functools.cached_property
     def call(self, /) -> CallFactory:
@@ -877,14 +1276,36 @@ class Handler:
     ...         ...
     """
 
+    _remote_methods: ClassVar[dict[str, str]] = {}
+
+    def __init_subclass__(cls, /, **kwargs: Any) -> None:
+        # ``object`` accepts no keywords, but a cooperative sibling class might.
+        super().__init_subclass__(**kwargs)  # type: ignore[call-arg]
+        # Scan the class namespaces (not the instance, to avoid calling ``getattr(...)``
+        # on properties) once per class, instead of once per handler instance.
+        namespace: dict[str, Any] = {}
+        for base in reversed(cls.__mro__):
+            namespace.update(vars(base))
+        cls._remote_methods = {}
+        for attr, func in namespace.items():
+            # Static methods are exposed, like functions, but class methods are not.
+            if isinstance(func, staticmethod):
+                func = func.__func__
+            if inspect.isfunction(func) and hasattr(func, '__remote__'):
+                cls._remote_methods[func.__remote__] = attr
+
     @functools.cached_property
-    def _method_table(self) -> dict[str, types.MethodType]:
-        """A mapping of method names to (possibly coroutine) bound methods."""
-        # Need to use the class to avoid calling `getattr(...)` on this property.
-        # Accessing bound methods directly can lead to infinite recursion.
-        funcs = inspect.getmembers(self.__class__, inspect.isfunction)
-        funcs = [(attr, func) for attr, func in funcs if hasattr(func, '__remote__')]
-        return {func.__remote__: getattr(self, attr) for attr, func in funcs}
+    def _method_table(self) -> dict[str, tuple[types.MethodType, bool]]:
+        """A mapping of method names to bound methods and whether each is a coroutine.
+
+        Checking whether a method is a coroutine function once here spares
+        :meth:`dispatch` from inspecting the method on every call.
+        """
+        table = {}
+        for name, attr in self._remote_methods.items():
+            method = getattr(self, attr)
+            table[name] = method, inspect.iscoroutinefunction(method)
+        return table
 
     async def dispatch(self, method: str, *args: Any, timeout: float = 30) -> Any:
         """Dispatch a remote procedure call.
@@ -903,15 +1324,19 @@ class Handler:
             RemoteCallError: The procedure call does not exist, timed out, or raised an
                 exception.
         """
-        func = self._method_table.get(method)
-        if not func:
+        entry = self._method_table.get(method)
+        if not entry:
             raise RemoteCallError('no such method exists', method=method)
+        func, is_coroutine = entry
         try:
-            if inspect.iscoroutinefunction(func):
+            if is_coroutine:
                 call = func(*args)
             else:
-                call = asyncio.to_thread(func, *args)
-            return await asyncio.wait_for(call, timeout)
+                # Unlike ``asyncio.to_thread``, do not copy the context on every call
+                # (no handler relies on context variables).
+                loop = asyncio.get_running_loop()
+                call = loop.run_in_executor(None, func, *args)
+            return await _wait_for(call, timeout)
         except asyncio.TimeoutError as exc:
             raise RemoteCallError('method timed out', timeout=timeout) from exc
         except Exception as exc:
@@ -958,10 +1383,12 @@ class Service(Endpoint):
                 exc_info=exc,
             )
         if message_type is MessageType.REQUEST:
-            response = [MessageType.RESPONSE.value, message_id, error, result]
-            await self.node.send([await _encode(response)], address=address)
+            response = await _encode_response(message_id, error, result)
+            await self.node.send([response], address=address)
 
 
+# Routers see the same few endpoint identities over and over.
+@functools.lru_cache(maxsize=256)
 def _render_id(identity: bytes) -> str:
     with contextlib.suppress(UnicodeDecodeError):
         decoded = identity.decode()
@@ -989,9 +1416,12 @@ async def _route(recv_socket: SocketNode, send_socket: SocketNode) -> NoReturn:
         send_socket=_render_id(send_socket.identity),
     )
     await logger.info('Router started')
+    batch: collections.deque[Segments] = collections.deque()
     while True:
         try:
-            frames, sender_id = await recv_socket.recv()
+            if not batch:
+                batch.extend(await recv_socket.recv_batch())
+            frames, sender_id = batch.popleft()
             if frames == [b'']:
                 await logger.info(
                     'Router connected to endpoint',
@@ -999,7 +1429,8 @@ async def _route(recv_socket: SocketNode, send_socket: SocketNode) -> NoReturn:
                 )
                 continue
             recipient_id, payload = frames
-            await logger.debug(
+            # See ``Endpoint._process_forever`` for why this event is logged synchronously.
+            logger.sync_bl.debug(
                 'Router received message',
                 sender_id=_render_id(sender_id),
                 recipient_id=_render_id(recipient_id),
@@ -1010,7 +1441,22 @@ async def _route(recv_socket: SocketNode, send_socket: SocketNode) -> NoReturn:
                     sender_id=_render_id(sender_id),
                 )
                 continue
-            await send_socket.send([sender_id, payload], address=recipient_id)
+            try:
+                # A full or unreachable recipient must not stall (or, if the socket
+                # were reopened, disconnect) every other endpoint, so drop the message.
+                await send_socket.send(
+                    [sender_id, payload],
+                    address=recipient_id,
+                    block=False,
+                )
+            except zmq.ZMQError as exc:
+                if exc.errno not in {zmq.EAGAIN, zmq.EHOSTUNREACH}:
+                    raise
+                logger.sync_bl.debug(
+                    'Router dropped message',
+                    recipient_id=_render_id(recipient_id),
+                    reason=exc.strerror,
+                )
         except (ValueError, RemoteCallError) as exc:
             await logger.error('Router failed to route message', exc_info=exc)
 
@@ -1022,24 +1468,28 @@ class Router:
     Routers are stateless, duplex, and symmetric (*i.e.*, require the same format and
     exhibit the same behavior on both ends).
 
-    Routers have no error handling and may silently drop messages if the destination is
-    unreachable. Clients must rely on timeouts to determine when to consider a request
-    failed.
+    Routers have no error handling and drop messages if the destination is unreachable
+    or its queue is full. Clients must rely on timeouts to determine when to consider a
+    request failed.
+
+    By default, the sockets set ``ZMQ_ROUTER_MANDATORY`` so that the router notices (and
+    logs) dropped messages instead of discarding them silently. Routing never waits on
+    a slow recipient, so one full queue cannot stall delivery to other endpoints.
 
     The payloads themselves are opaque to the router and are not deserialized.
 
     Parameters:
         frontend: A ``ROUTER`` socket clients connect to.
         backend: A ``ROUTER`` socket services connect to.
-        route_task: The background task performing the routing. :class:`Router`
-            implements the async context manager protocol, which automatically schedules
-            and cancels this task.
+        route_tasks: The background tasks performing the routing (one per direction).
+            :class:`Router` implements the async context manager protocol, which
+            automatically schedules and cancels these tasks.
     """
 
     frontend: SocketNode
     backend: SocketNode
-    route_task: asyncio.Future[tuple[NoReturn, NoReturn]] = field(
-        default_factory=lambda: asyncio.get_running_loop().create_future(),
+    route_tasks: tuple[asyncio.Task[NoReturn], ...] = field(
+        default=(),
         init=False,
         repr=False,
     )
@@ -1051,7 +1501,7 @@ class Router:
     async def __aenter__(self, /) -> 'Router':
         await self.frontend.__aenter__()
         await self.backend.__aenter__()
-        self.route_task = asyncio.gather(
+        self.route_tasks = (
             asyncio.create_task(_route(self.frontend, self.backend), name='route-req'),
             asyncio.create_task(_route(self.backend, self.frontend), name='route-res'),
         )
@@ -1063,9 +1513,10 @@ class Router:
         exc: Optional[BaseException],
         traceback: Optional[types.TracebackType],
     ) -> None:
-        self.route_task.cancel()
+        for task in self.route_tasks:
+            task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
-            await self.route_task
+            await asyncio.gather(*self.route_tasks)
         await self.frontend.__aexit__(exc_type, exc, traceback)
         await self.backend.__aexit__(exc_type, exc, traceback)
 
@@ -1083,6 +1534,8 @@ class Router:
         backend_options = backend_options or {}
         frontend_options.setdefault(zmq.IDENTITY, b'router-frontend')
         backend_options.setdefault(zmq.IDENTITY, b'router-backend')
+        frontend_options.setdefault(zmq.ROUTER_MANDATORY, 1)
+        backend_options.setdefault(zmq.ROUTER_MANDATORY, 1)
         return Router(
             SocketNode(
                 socket_type=zmq.ROUTER,
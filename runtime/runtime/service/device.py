@@ -203,7 +203,9 @@ class SmartDevice(abc.ABC):  # https://github.com/python/mypy/issues/5374
                 buf_view = memoryview(buf)[: -len(Message.DELIM)]
                 message = await asyncio.to_thread(Message.decode, buf_view)
                 await self.read_queue.put(message)
-                await self.logger.debug('Read message', type=message.type.name)
+                # The async logger hops to a thread even to drop an event, so log
+                # per-message debug events (usually filtered out) synchronously.
+                self.logger.sync_bl.debug('Read message', type=message.type.name)
             except MessageError as exc:
                 await self.logger.error('Message read error', exc_info=exc)
                 status = exc.context.get('status', ErrorCode.GENERIC_ERROR.name)
@@ -223,7 +225,7 @@ class SmartDevice(abc.ABC):  # https://github.com/python/mypy/issues/5374
                 size = await asyncio.to_thread(message.encode_into_buf, write_buf)
                 self.writer.write(write_buf[:size])
                 self.writer.write(Message.DELIM)
-                await self.logger.debug('Wrote message', type=message.type.name)
+                self.logger.sync_bl.debug('Wrote message', type=message.type.name)
             except MessageError as exc:
                 await self.logger.error('Message write error', exc_info=exc)
                 self.writer.write(generic_error)
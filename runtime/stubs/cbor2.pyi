@@ -1,8 +1,17 @@
-from typing import Any
+from typing import IO, Any
 
 class CBORError(Exception): ...
 class CBOREncodeError(CBORError): ...
 class CBORDecodeError(CBORError): ...
 
+class CBOREncoder:
+    def __init__(self, fp: IO[bytes], **kwargs: Any) -> None: ...
+    def write(self, buf: bytes) -> None: ...
+    def encode(self, obj: Any) -> None: ...
+
+class CBORDecoder:
+    def __init__(self, fp: IO[bytes], **kwargs: Any) -> None: ...
+    def decode_from_bytes(self, buf: bytes) -> Any: ...
+
 def dumps(obj: Any) -> bytes: ...
 def loads(buf: bytes) -> Any: ...
@@ -1,5 +1,10 @@
+from typing import Any, Optional, Union
+
+from .error import ZMQError as ZMQError
+
 PUB: int
 SUB: int
+XPUB: int
 ROUTER: int
 DEALER: int
 FORWARDER: int
@@ -7,3 +12,21 @@ SUBSCRIBE: int
 IDENTITY: int
 PROBE_ROUTER: int
 ROUTER_HANDOVER: int
+ROUTER_MANDATORY: int
+DONTWAIT: int
+EAGAIN: int
+EHOSTUNREACH: int
+
+class Socket:
+    def bind(self, addr: str) -> None: ...
+    def setsockopt(self, option: int, optval: Union[int, bytes]) -> None: ...
+    def close(self, linger: Optional[int] = ...) -> None: ...
+
+class Context:
+    @classmethod
+    def shadow(cls, address: int) -> 'Context': ...
+    def socket(self, socket_type: int, **kwargs: Any) -> Socket: ...
+
+def proxy(
+    frontend: Socket, backend: Socket, capture: Optional[Socket] = ...
+) -> None: ...
@@ -30,3 +30,5 @@ class Context:
     def instance(io_threads: int = ...) -> 'Context': ...
     def socket(self, socket_type: int, **kwargs: Any) -> Socket: ...
     def term(self) -> None: ...
+    @property
+    def underlying(self) -> int: ...
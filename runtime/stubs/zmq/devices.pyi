@@ -14,3 +14,4 @@ class ThreadDevice(Device):
     def start(self) -> None: ...
     def join(self, timeout: Optional[float] = ...) -> None: ...
     def setsockopt_in(self, opt: int, value: Union[int, bytes]) -> None: ...
+    def run_device(self) -> None: ...
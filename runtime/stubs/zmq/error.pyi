@@ -1,3 +1,9 @@
+from typing import Optional
+
 class ZMQBaseError(Exception): ...
-class ZMQError(ZMQBaseError): ...
+
+class ZMQError(ZMQBaseError):
+    errno: Optional[int]
+    strerror: str
+
 class Again(ZMQError): ...
@@ -1,3 +1,4 @@
+import copy
 import ctypes
 import multiprocessing
 import time
@@ -375,6 +376,16 @@ def test_duplicate_registration():
         BufferStore(BufferStore.make_catalog(catalog))
 
 
+def test_catalog_not_mutated():
+    catalog = {'dev': {'device_id': 0x80, 'params': [{'name': 'x', 'type': 'float'}]}}
+    snapshot = copy.deepcopy(catalog)
+    Dev1 = BufferStore.make_catalog(catalog)['dev']
+    Dev2 = BufferStore.make_catalog(catalog)['dev']
+    assert catalog == snapshot
+    assert list(Dev1.params.values()) == list(Dev2.params.values())
+    assert ctypes.sizeof(Dev1) == ctypes.sizeof(Dev2)
+
+
 def test_key_equivalence(buffers):
     buf1 = buffers.get_or_open(0x80_00_00000000_00000000)
     buf2 = buffers['example-device', 0x80_00_00000000_00000000]
@@ -1,5 +1,7 @@
 import asyncio
+import collections
 import multiprocessing
+import os
 import random
 import signal
 import time
@@ -14,6 +16,13 @@ import zmq.asyncio
 from runtime import process, remote
 from runtime.exception import EmergencyStopException, RuntimeBaseException
 
+BASE_OPTIONS = {
+    'debug': False,
+    'thread_pool_workers': 1,
+    'log_format': 'json',
+    'log_level': 'info',
+}
+
 
 @pytest.fixture
 async def app():
@@ -90,6 +99,33 @@ async def test_process_run():
     assert len(multiprocessing.active_children()) == 0
 
 
+@pytest.mark.asyncio
+async def test_process_wait_cancel():
+    done = multiprocessing.Event()
+    proc = process.AsyncProcess(target=done.wait)
+    proc.start()
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(proc.wait(), 0.05)
+    done.set()
+    await asyncio.wait_for(proc.wait(), 1)
+    assert not proc.is_alive()
+
+
+def closed_sentinel_target():
+    os.closerange(3, os.sysconf('SC_OPEN_MAX'))
+    time.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_process_closed_sentinel(monkeypatch):
+    monkeypatch.delattr(os, 'pidfd_open', raising=False)
+    proc = process.AsyncProcess(target=closed_sentinel_target)
+    proc.start()
+    assert proc.pidfd is None
+    assert await asyncio.wait_for(proc.wait(), 2) == 0
+    assert not proc.is_alive()
+
+
 def indefinite_target(handle_termination):
     signal.signal(signal.SIGTERM, handle_termination)
     while True:
@@ -119,6 +155,13 @@ async def test_process_kill():
     assert await proc != 0
 
 
+@pytest.mark.asyncio
+async def test_process_timeout():
+    proc = process.AsyncProcess(target=indefinite_target, args=(lambda *_: exit(0xF),))
+    assert await process.run_process(proc, timeout=0.3) == 0xF
+    assert not proc.is_alive()
+
+
 @pytest.mark.asyncio
 async def test_process_estop():
     def target():
@@ -130,6 +173,36 @@ async def test_process_estop():
         await process.run_process(proc)
 
 
+@pytest.mark.asyncio
+async def test_spin(mocker):
+    # Run against a fake clock, so the test does not depend on scheduling jitter.
+    clock, delays = 0.0, []
+
+    async def tick(duration):
+        nonlocal clock
+        clock += duration
+
+    async def sleep(delay):
+        nonlocal clock
+        delays.append(delay)
+        clock += delay
+        if len(delays) == 3:
+            raise asyncio.CancelledError
+
+    mocker.patch.object(asyncio.get_running_loop(), 'time', lambda: clock)
+    mocker.patch('asyncio.sleep', sleep)
+    with pytest.raises(asyncio.CancelledError):
+        await process.spin(tick, 0.03, interval=0.1)
+    # The callback's duration does not add to the period.
+    assert delays == pytest.approx([0.07] * 3)
+    assert clock == pytest.approx(0.3)
+    delays.clear()
+    with pytest.raises(asyncio.CancelledError):
+        await process.spin(tick, duration=0.15, interval=0.1)
+    # A callback that overruns the interval is called again immediately.
+    assert delays == [0, 0, 0]
+
+
 @pytest.mark.asyncio
 async def test_loop_debug(app):
     assert asyncio.get_running_loop().get_debug()
@@ -144,6 +217,68 @@ async def test_loop_default_executor(app):
     assert loop.time() - start == pytest.approx(1.5, rel=0.1)
 
 
+def test_stealing_thread_pool():
+    pool = process.StealingThreadPool(3, thread_name_prefix='stealer')
+
+    def fanout(n):
+        # Submissions from a worker go onto that worker's deque and are stolen by peers.
+        return sum(pool.submit(pow, i, 2).result() for i in range(n))
+
+    futures = [pool.submit(fanout, 10) for _ in range(2)]
+    assert [future.result(timeout=1) for future in futures] == [285, 285]
+    with pytest.raises(ZeroDivisionError):
+        pool.submit(lambda: 1 / 0).result(timeout=1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(pow, 2, 2)
+
+
+def test_stealing_thread_pool_shutdown_race():
+    pool = process.StealingThreadPool(2)
+    assert pool.submit(pow, 2, 2).result(timeout=1) == 4
+
+    class ShutdownDeque(collections.deque):
+        def append(self, item):
+            # Shut down between the submission's shutdown check and its append.
+            pool.shutdown()
+            super().append(item)
+
+    pool._deques[:] = [ShutdownDeque() for _ in pool._deques]
+    with pytest.raises(RuntimeError):
+        pool.submit(pow, 2, 2)
+    assert not any(pool._deques)
+    assert not any(worker.is_alive() for worker in pool._workers)
+
+
+@pytest.mark.asyncio
+async def test_loop_stealing_executor():
+    options = BASE_OPTIONS | {'thread_pool_workers': 2, 'thread_pool_kind': 'stealing'}
+    async with process.Application('test', options) as app:
+        assert isinstance(app.executor, process.StealingThreadPool)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(pow, i, 2) for i in range(8))
+        )
+        assert results == [i ** 2 for i in range(8)]
+
+
+@pytest.mark.asyncio
+async def test_stop_signal():
+    async with process.Application('test', BASE_OPTIONS) as app:
+        signal.raise_signal(signal.SIGTERM)
+        signal.raise_signal(signal.SIGINT)
+        await asyncio.sleep(1)
+    assert app.stop_signal == signal.SIGTERM
+
+
+@pytest.mark.asyncio
+async def test_nested_apps():
+    async with process.Application('outer', BASE_OPTIONS):
+        async with process.Application('inner', BASE_OPTIONS):
+            ctx = zmq.asyncio.Context.instance()
+        assert not ctx.closed
+    assert ctx.closed
+
+
 @pytest.mark.asyncio
 async def test_loop_exc_handler(mocker, app):
     logger = mocker.patch('structlog.stdlib.BoundLogger.error')
@@ -175,7 +310,10 @@ async def test_loop_exc_handler(mocker, app):
 async def test_routing(app):
     client = await app.make_client()
     service = await app.make_service(MathHandler())
+    assert client.node.identity == b'test-client'
     assert await client.call.add(1, 2, address=b'test-service') == 3
+    # Each node gets its own copy of the options.
+    assert zmq.PROBE_ROUTER not in app.client_node_options
 
 
 @pytest.mark.slow
@@ -185,6 +323,8 @@ async def test_log_forwarder(app):
     await asyncio.sleep(0.1)
     handler = LogHandler()
     subscriber = await app.make_log_subscriber(handler)
+    assert subscriber.node.connections == {'inproc://test-log-frontend'}
+    assert app.log_forwarder.cpus <= os.sched_getaffinity(0)
     await asyncio.sleep(0.1)
     logger = structlog.get_logger()
     await logger.debug('debug msg')
@@ -203,6 +343,27 @@ async def test_log_forwarder(app):
     assert warning['event'] == 'warning msg'
 
 
+@pytest.mark.asyncio
+async def test_log_forwarder_exit():
+    options = BASE_OPTIONS | {'log_backend': [], 'log_frontend': []}
+    async with process.Application('test', options) as app:
+        forwarder = await app.make_log_forwarder()
+        assert forwarder.launcher.is_alive()
+    assert not forwarder.launcher.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_log_publisher_timeout(mocker):
+    port = random.randrange(3000, 10000)
+    options = BASE_OPTIONS | {'log_backend': [f'tcp://*:{port}']}
+    async with process.Application('test', options) as app:
+        wait = mocker.spy(process, '_wait_for_subscription')
+        publisher = await app.make_log_publisher(timeout=0.05)
+        assert publisher.node.socket_type == zmq.XPUB
+        assert not publisher.node.can_recv
+        assert wait.spy_return is False
+
+
 @pytest.mark.asyncio
 async def test_update(app):
     client = await app.make_update_client()
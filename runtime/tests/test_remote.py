@@ -1,7 +1,8 @@
 import asyncio
+import contextlib
 import functools
 import math
-import random
+import sys
 from dataclasses import dataclass, field
 from numbers import Real
 from typing import Callable, Optional
@@ -163,6 +164,183 @@ async def test_checks():
         await node.send([b''])
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'size,offloaded', [(16, False), (remote.INLINE_CODEC_THRESHOLD, True)]
+)
+async def test_codec(mocker, size, offloaded):
+    to_thread = mocker.spy(asyncio, 'to_thread')
+    message = [remote.MessageType.REQUEST.value, 1, 'echo', [b'x' * size]]
+    buf = await remote._encode_call('echo', [b'x' * size], 1)
+    assert buf == cbor2.dumps(message)
+    assert await remote._decode(buf) == message
+    assert to_thread.call_count == (2 if offloaded else 0)
+
+
+@pytest.mark.asyncio
+async def test_request_tracker():
+    tracker = remote.RequestTracker(lower=4, upper=7)
+    with contextlib.ExitStack() as stack:
+        ids = {stack.enter_context(tracker.new_request())[0] for _ in range(4)}
+        assert ids == {4, 5, 6, 7}
+        with pytest.raises(ValueError):
+            tracker.generate_uid()
+    assert not tracker.futures
+
+
+@pytest.mark.asyncio
+async def test_encode_call():
+    args = (1, 'a', [b'b'])
+    request = [remote.MessageType.REQUEST, 123456, 'echo-id', args]
+    assert await remote._encode_call('echo-id', args, 123456) == cbor2.dumps(request)
+    notification = [remote.MessageType.NOTIFICATION, 'echo-id', args]
+    assert await remote._encode_call('echo-id', args) == cbor2.dumps(notification)
+    response = [remote.MessageType.RESPONSE, 123456, None, args]
+    assert await remote._encode_response(123456, None, args) == cbor2.dumps(response)
+
+
+@pytest.mark.asyncio
+async def test_handler_methods():
+    class BaseHandler(remote.Handler):
+        @remote.route
+        def hidden(self):
+            return 'base'
+
+        @staticmethod
+        @remote.route('static')
+        async def static_method():
+            return 'static'
+
+    class DerivedHandler(BaseHandler):
+        def hidden(self):
+            return 'derived'
+
+    assert BaseHandler._remote_methods == {
+        'hidden': 'hidden',
+        'static': 'static_method',
+    }
+    handler = DerivedHandler()
+    assert handler._remote_methods == {'static': 'static_method'}
+    assert await handler.dispatch('static') == 'static'
+    with pytest.raises(remote.RemoteCallError):
+        await handler.dispatch('hidden')
+
+
+@pytest.mark.asyncio
+async def test_dispatch_timeout():
+    handler = MockHandler()
+    with pytest.raises(remote.RemoteCallError) as excinfo:
+        await handler.dispatch('inc', timeout=0.01)
+    assert excinfo.value.context['timeout'] == 0.01
+    assert handler.waiters == 0
+    # A call that finishes resumes the dispatcher without a wrapper task: the slot it
+    # occupies frees up two loop iterations after the handler is released.
+    task = asyncio.create_task(handler.dispatch('inc'))
+    await handler.poll(lambda: handler.waiters == 1)
+    handler.barrier.set()
+    for _ in range(2):
+        await asyncio.sleep(0)
+    assert task.done() and task.result() is None
+    assert handler.total == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_for():
+    assert await remote._wait_for(asyncio.sleep(0, 'done'), 1) == 'done'
+    future = asyncio.get_running_loop().create_future()
+    with pytest.raises(asyncio.TimeoutError):
+        await remote._wait_for(future, 0.01)
+    assert future.cancelled()
+    task = asyncio.create_task(remote._wait_for(asyncio.sleep(1), 1))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    if sys.version_info >= (3, 11):
+        # Cancelling the caller after expiry, while the awaitable is still unwinding,
+        # is a cancellation, not a timeout.
+        async def unwind_slowly():
+            try:
+                await asyncio.sleep(1)
+            finally:
+                await asyncio.sleep(0.05)
+
+        inner = asyncio.ensure_future(unwind_slowly())
+        task = asyncio.create_task(remote._wait_for(inner, 0.01))
+        await asyncio.sleep(0.03)
+        assert not inner.done()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert inner.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_recv_batch():
+    node = remote.DatagramNode.from_address(UDP_ADDR)
+    for i in range(5):
+        node.recv_queue.put_nowait(([bytes([i])], None))
+    batch = await node.recv_batch(3)
+    assert [frames for frames, _ in batch] == [[b'\x00'], [b'\x01'], [b'\x02']]
+    assert len(await node.recv_batch()) == 2
+    assert node.recv_count == 5
+
+
+@pytest.mark.asyncio
+async def test_recv_queue():
+    queue = remote._RecvQueue(2)
+    queue.put_nowait(([b'a'], None))
+    await queue.put(([b'b'], None))
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(([b'c'], None))
+    producer = asyncio.create_task(queue.put(([b'c'], None)))
+    await asyncio.sleep(0)
+    assert not producer.done()
+    queue.requeue(([b'x'], None))
+    assert queue.get_nowait() == ([b'x'], None)
+    await asyncio.sleep(0)
+    assert not producer.done()
+    assert queue.get_nowait() == ([b'a'], None)
+    await producer
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [
+        ([b'b'], None),
+        ([b'c'], None),
+    ]
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_recv_handoff():
+    node = remote.DatagramNode.from_address(UDP_ADDR)
+    receivers = [asyncio.create_task(node.recv()) for _ in range(3)]
+    await asyncio.sleep(0)
+    receivers[0].cancel()
+    node.datagram_received(b'a', None)
+    node.datagram_received(b'b', None)
+    node.datagram_received(b'c', None)
+    assert await asyncio.gather(*receivers[1:]) == [([b'a'], None), ([b'b'], None)]
+    assert node.recv_queue.get_nowait() == ([b'c'], None)
+    # Receivers that time out do not leave stale waiters behind.
+    for _ in range(3):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(node.recv(), 0.01)
+    assert not node.recv_waiters
+    # A message handed to a receiver cancelled before it resumes is not lost or
+    # reordered, even if the queue has filled up in the meantime.
+    receiver = asyncio.create_task(node.recv())
+    await asyncio.sleep(0)
+    node.datagram_received(b'd', None)
+    for i in range(node.recv_queue.maxsize + 1):
+        node.datagram_received(bytes([i]), None)
+    receiver.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await receiver
+    assert node.recv_queue.get_nowait() == ([b'd'], None)
+    assert node.recv_queue.get_nowait() == ([b'\x00'], None)
+    assert node.recv_count == 2
+
+
 @pytest.mark.asyncio
 async def test_request_response(endpoints):
     client, service = endpoints
@@ -184,18 +362,24 @@ async def test_notification(endpoints):
         notification=True,
     )
     await asyncio.gather(*(fn() for _ in range(requests)))
-    current, batches = requests, 0
-    while current > 0:
-        to_process = min(current, service.concurrency)
+
+    def release():
+        # Swap in a fresh barrier so that the next batch, which may start as soon as a
+        # slot frees up, waits instead of passing through the one just set.
+        barrier, service.handler.barrier = service.handler.barrier, asyncio.Event()
+        barrier.set()
+
+    processed, batches = 0, 0
+    while processed < requests:
+        to_process = min(requests - processed, service.concurrency)
         await service.handler.poll(
             lambda: service.handler.waiters == to_process,
-            service.handler.barrier.set,
+            release,
         )
+        processed += to_process
         await service.handler.poll(
-            lambda: service.handler.waiters == 0,
-            service.handler.barrier.clear,
+            lambda: service.handler.total - service.handler.waiters == processed,
         )
-        current -= to_process
         batches += 1
     assert service.handler.total == requests
     assert batches == int(math.ceil(requests / service.concurrency))
@@ -241,8 +425,7 @@ async def test_bad_requests(mocker, endpoints):
     if isinstance(client.node, remote.SocketNode):
         with pytest.raises(remote.RemoteCallError):
             await client.call['echo-id']()  # No address
-    mocker.patch('random.randint')
-    random.randint.return_value = 0
+    mocker.patch.object(remote.RequestTracker, '_try_generate_id', return_value=0)
     with client.requests.new_request():
         with pytest.raises(ValueError):
             await client.call['echo-id'](1, address=service.node.address)
@@ -257,14 +440,14 @@ async def test_bad_payloads(endpoints):
     service_payloads = [
         [b''],
         [b''] * 2,
-        [await remote._encode([])],
-        [(await remote._encode([]))[:-1]],
-        [await remote._encode('abcd')],
-        [await remote._encode([5, 0, None, None])],
-        [await remote._encode([remote.MessageType.RESPONSE.value, 0, None, None])],
+        [cbor2.dumps([])],
+        [cbor2.dumps([])[:-1]],
+        [cbor2.dumps('abcd')],
+        [cbor2.dumps([5, 0, None, None])],
+        [cbor2.dumps([remote.MessageType.RESPONSE.value, 0, None, None])],
     ]
     bad_request = [remote.MessageType.REQUEST.value, 0, 'generate_message_id', ()]
-    client_payloads = [*service_payloads, [await remote._encode(bad_request)]]
+    client_payloads = [*service_payloads, [cbor2.dumps(bad_request)]]
     for _ in range(3):
         for payload in service_payloads:
             await client.node.send(payload, address=service.node.address)
@@ -420,6 +603,34 @@ async def test_service_death(endpoints):
     assert await client.call['echo-id'](1, address=service.node.address) == 2
 
 
+@pytest.mark.asyncio
+async def test_router_slow_peer():
+    frontend, backend = 'inproc://slow-frontend', 'inproc://slow-backend'
+    router = remote.Router.bind({frontend}, {backend}, {}, {zmq.SNDHWM: 1})
+    addresses = {b'client': frontend, b'slow': backend, b'ok': backend}
+    ctx = zmq.asyncio.Context.instance()
+    peers = {identity: ctx.socket(zmq.DEALER) for identity in addresses}
+    try:
+        async with router:
+            backend_socket = router.backend.socket
+            for identity, address in addresses.items():
+                peers[identity].set(zmq.IDENTITY, identity)
+                peers[identity].set(zmq.RCVHWM, 1)
+                peers[identity].connect(address)
+            await asyncio.sleep(0.1)
+            # The slow peer never reads, so its queue fills and later messages are dropped.
+            for _ in range(100):
+                await peers[b'client'].send_multipart([b'slow', b'payload'])
+            await peers[b'client'].send_multipart([b'ok', b'payload'])
+            frames = await asyncio.wait_for(peers[b'ok'].recv_multipart(), 1)
+            assert frames == [b'client', b'payload']
+            assert router.backend.socket is backend_socket
+            assert not any(task.done() for task in router.route_tasks)
+    finally:
+        for socket in peers.values():
+            socket.close(linger=0)
+
+
 @pytest.mark.slow
 @pytest.mark.asyncio
 async def test_loopback(endpoints):
@@ -430,7 +641,7 @@ async def test_loopback(endpoints):
     await asyncio.sleep(0.3)
     message = [remote.MessageType.REQUEST.value, 0, 'inc', ()]
     await service.node.send(
-        [await remote._encode(message)],
+        [cbor2.dumps(message)],
         address=service.node.address,
     )
     await asyncio.sleep(0.3)